@@ -31,6 +31,7 @@ class EstimatorsKeys(Enum):
     """
 
     PyroSVI = "pyro-svi"
+    NumPyroSVI = "numpyro-svi"
     StanMAP = "stan-map"
     StanMCMC = "stan-mcmc"
 
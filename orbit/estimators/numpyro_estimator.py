@@ -0,0 +1,183 @@
+from abc import abstractmethod
+from importlib.util import find_spec
+import numpy as np
+import logging
+
+from .base_estimator import BaseEstimator
+from ..exceptions import EstimatorException
+from ..utils.numpyro import get_numpyro_model
+
+# jax and numpyro are only imported in `fit()` so importing orbit does not load them unless a NumPyro
+# estimator is fitted
+NUMPYRO_INSTALLED = find_spec("numpyro") is not None and find_spec("jax") is not None
+
+logger = logging.getLogger("orbit")
+
+
+class NumPyroEstimator(BaseEstimator):
+    """Abstract NumPyroEstimator with shared args for all NumPyroEstimator child classes
+
+    Parameters
+    ----------
+    num_steps : int
+        Number of estimator steps in optimization
+    learning_rate : float
+        Estimator learning rate
+    learning_rate_total_decay : float
+        A config mirroring the one in :class:`~orbit.estimators.pyro_estimator.PyroEstimator`. For example,
+        0.1 means a 90% reduction of the final step as of original learning rate where exponential decay is
+        implied along the steps. In the case of 1.0, no decay is applied.
+    seed : int
+        Seed int
+    message : int
+        Print to console every `message` number of steps
+    kwargs
+        Additional BaseEstimator args
+    Notes
+    -----
+        See https://num.pyro.ai/en/stable/optimizers.html for optimizer details. JAX 64-bit mode is enabled only
+        within `fit()` so the global JAX configuration of the process is left untouched.
+    """
+
+    def __init__(
+        self,
+        num_steps=301,
+        learning_rate=0.1,
+        learning_rate_total_decay=1.0,
+        message=100,
+        **kwargs,
+    ):
+        if not NUMPYRO_INSTALLED:
+            raise EstimatorException(
+                "numpyro and jax are required to use the NumPyro estimators."
+            )
+        super().__init__(**kwargs)
+        self.num_steps = num_steps
+        self.learning_rate = learning_rate
+        self.learning_rate_total_decay = learning_rate_total_decay
+        self.message = message
+
+    @abstractmethod
+    def fit(
+        self, model_name, model_param_names, data_input, fitter=None, init_values=None
+    ):
+        raise NotImplementedError("Concrete fit() method must be implemented")
+
+
+class NumPyroEstimatorSVI(NumPyroEstimator):
+    """NumPyro Estimator for VI Sampling
+
+    Parameters
+    ----------
+    num_sample : int
+        Number of samples ot draw for inference, default 100
+    num_particles : int
+        Number of particles used in :class: `~numpyro.infer.Trace_ELBO` for SVI optimization
+    init_scale : float
+        Parameter used in `numpyro.infer.autoguide`; recommend a larger number of small dataset
+    kwargs
+        Additional `NumPyroEstimator` class args
+
+    """
+
+    def __init__(self, num_sample=100, num_particles=100, init_scale=0.1, **kwargs):
+        super().__init__(**kwargs)
+        self.num_sample = num_sample
+        self.num_particles = num_particles
+        self.init_scale = init_scale
+
+    def fit(
+        self,
+        model_name,
+        model_param_names,
+        data_input,
+        sampling_temperature,
+        fitter=None,
+        init_values=None,
+    ):
+        import jax
+        from numpyro.infer import SVI, Trace_ELBO, Predictive
+        from numpyro.infer.autoguide import AutoLowRankMultivariateNormal
+        from numpyro.optim import ClippedAdam
+
+        try:
+            from jax import enable_x64
+        except ImportError:
+            # older jax releases only ship the context manager under `jax.experimental`
+            from jax.experimental import enable_x64
+
+        data_input.update({"T_STAR": sampling_temperature})
+        verbose = self.verbose
+        message = self.message
+        learning_rate = self.learning_rate
+        learning_rate_total_decay = self.learning_rate_total_decay
+        num_sample = self.num_sample
+        seed = self.seed
+        num_steps = self.num_steps
+        if self.verbose:
+            msg_template = (
+                "Using SVI (NumPyro) with steps: {}, samples: {}, learning rate: {},"
+                " learning_rate_total_decay: {} and particles: {}."
+            )
+            msg = msg_template.format(
+                self.num_steps,
+                self.num_sample,
+                self.learning_rate,
+                self.learning_rate_total_decay,
+                self.num_particles,
+            )
+            logger.info(msg)
+
+        # models are defined in double precision; keep 64-bit mode scoped to the fit
+        with enable_x64(True):
+            if fitter is None:
+                fitter = get_numpyro_model(model_name)  # abstract
+            model = fitter(data_input)  # concrete
+
+            # Perform stochastic variational inference using an auto guide.
+            guide = AutoLowRankMultivariateNormal(model, init_scale=self.init_scale)
+            lrd = learning_rate_total_decay ** (1 / num_steps)
+            optim = ClippedAdam(step_size=lambda i: learning_rate * lrd**i)
+            elbo = Trace_ELBO(num_particles=self.num_particles)
+            svi = SVI(model, guide, optim, elbo)
+
+            rng_key, sample_key = jax.random.split(jax.random.PRNGKey(seed))
+            svi_state = svi.init(rng_key)
+            update = jax.jit(svi.update)
+            loss_elbo = list()
+            for step in range(num_steps):
+                svi_state, loss = update(svi_state)
+                loss = float(loss)
+                loss_elbo.append(loss)
+                if verbose and step % message == 0:
+                    logger.info("step {: >4d} loss = {:0.5g}".format(step, loss))
+
+            # Extract samples.
+            params = svi.get_params(svi_state)
+            predictive = Predictive(
+                model,
+                guide=guide,
+                params=params,
+                num_samples=num_sample,
+                return_sites=list(model_param_names) + ["log_prob"],
+            )
+            samples = predictive(sample_key)
+
+            # Convert from jax arrays to numpy.ndarrays.
+            extract = {
+                name: np.asarray(value).squeeze() for name, value in samples.items()
+            }
+
+        # make sure that model param names are a subset of numpyro extract keys
+        invalid_model_param = set(model_param_names) - set(list(extract.keys()))
+        if invalid_model_param:
+            raise EstimatorException(
+                "NumPyro model definition does not contain required parameters"
+            )
+
+        posteriors = {param: extract[param] for param in model_param_names}
+        training_metrics = {"loss_elbo": np.array(loss_elbo)}
+        training_metrics.update({"loglk": extract["log_prob"]})
+        training_metrics.update({"sampling_temperature": sampling_temperature})
+
+        return posteriors, training_metrics
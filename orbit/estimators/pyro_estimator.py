@@ -3,7 +3,7 @@ import numpy as np
 import logging
 
 import pyro
-from pyro.infer import SVI, Trace_ELBO
+from pyro.infer import SVI, Trace_ELBO, JitTrace_ELBO
 from pyro.infer.autoguide import AutoLowRankMultivariateNormal, AutoDelta
 from pyro.optim import ClippedAdam
 
@@ -71,16 +71,28 @@ class PyroEstimatorSVI(PyroEstimator):
         Number of particles used in :class: `~pyro.infer.Trace_ELBO` for SVI optimization
     init_scale : float
         Parameter used in `pyro.infer.autoguide`; recommend a larger number of small dataset
+    jit_compile : bool
+        If True, use :class: `~pyro.infer.JitTrace_ELBO` to trace and compile the ELBO computation; default False.
+        It can speed up the optimization substantially but the traced graph is known to leak memory over
+        repeated fits in the same process.
     kwargs
         Additional `PyroEstimator` class args
 
     """
 
-    def __init__(self, num_sample=100, num_particles=100, init_scale=0.1, **kwargs):
+    def __init__(
+        self,
+        num_sample=100,
+        num_particles=100,
+        init_scale=0.1,
+        jit_compile=False,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.num_sample = num_sample
         self.num_particles = num_particles
         self.init_scale = init_scale
+        self.jit_compile = jit_compile
 
     def fit(
         self,
@@ -125,7 +137,16 @@ class PyroEstimatorSVI(PyroEstimator):
         optim = ClippedAdam(
             {"lr": learning_rate, "lrd": learning_rate_total_decay ** (1 / num_steps)}
         )
-        elbo = Trace_ELBO(num_particles=self.num_particles, vectorize_particles=True)
+        if self.jit_compile:
+            elbo = JitTrace_ELBO(
+                num_particles=self.num_particles,
+                vectorize_particles=True,
+                ignore_jit_warnings=True,
+            )
+        else:
+            elbo = Trace_ELBO(
+                num_particles=self.num_particles, vectorize_particles=True
+            )
         loss_elbo = list()
         svi = SVI(model, guide, optim, elbo)
         for step in range(num_steps):
@@ -2,6 +2,7 @@ from ..template.ktr import KTRModel
 from ..forecaster import SVIForecaster
 from ..exceptions import IllegalArgument
 from ..estimators.pyro_estimator import PyroEstimatorSVI
+from ..estimators.numpyro_estimator import NumPyroEstimatorSVI
 from ..constants.constants import EstimatorsKeys
 
 
@@ -36,6 +37,7 @@ def KTR(
     # TODO: rename to residuals upper bound
     residuals_scale_upper=None,
     ktrlite_optim_args=dict(),
+    float32_prediction=False,
     estimator="pyro-svi",
     **kwargs,
 ):
@@ -86,14 +88,18 @@ def KTR(
     coef_prior_list : list of dicts
         each dict in the list should have keys as
         'name', prior_start_tp_idx' (inclusive), 'prior_end_tp_idx' (not inclusive),
-        'prior_mean', 'prior_sd', and 'prior_regressor_col'
+        'prior_mean', 'prior_sd', and 'prior_regressor_col'; the dicts are copied but their values are
+        shared references and should not be mutated after passing
     residuals_scale_upper : float
     flat_multiplier : bool
         Default set as True. If False, we will adjust knot scale with a multiplier based on regressor volume
         around each knot; When True, set all multiplier as 1
     ktrlite_optim_args : dict
         the optimizing config for the ktrlite model (to fit level/seasonality). Default to be dict().
-    estimator : string; {'pyro-svi'}
+    float32_prediction : bool
+        Default set as False. If True, the trend and regression products in prediction are computed in float32 to
+        reduce memory bandwidth with long horizons or many posterior samples; fitting is not affected
+    estimator : string; {'pyro-svi', 'numpyro-svi'}
 
     Other Parameters
     ----------------
@@ -112,9 +118,13 @@ def KTR(
         confident intervals, pass an empty list
 
     **kwargs:
-        additional arguments passed into orbit.estimators.pyro_estimator
+        additional arguments passed into orbit.estimators.pyro_estimator or orbit.estimators.numpyro_estimator
+        e.g. `jit_compile=True` to trace and compile the ELBO computation in Pyro SVI
     """
-    _supported_estimators = [EstimatorsKeys.PyroSVI.value]
+    _supported_estimators = [
+        EstimatorsKeys.PyroSVI.value,
+        EstimatorsKeys.NumPyroSVI.value,
+    ]
 
     ktr = KTRModel(
         level_knot_scale=level_knot_scale,
@@ -141,11 +151,16 @@ def KTR(
         flat_multiplier=flat_multiplier,
         residuals_scale_upper=residuals_scale_upper,
         ktrlite_optim_args=ktrlite_optim_args,
+        float32_prediction=float32_prediction,
     )
     if estimator == EstimatorsKeys.PyroSVI.value:
         ktr_forecaster = SVIForecaster(
             model=ktr, estimator_type=PyroEstimatorSVI, **kwargs
         )
+    elif estimator == EstimatorsKeys.NumPyroSVI.value:
+        ktr_forecaster = SVIForecaster(
+            model=ktr, estimator_type=NumPyroEstimatorSVI, **kwargs
+        )
     else:
         raise IllegalArgument(
             "Invalid estimator. Must be one of {}".format(_supported_estimators)
@@ -0,0 +1,223 @@
+import numpy as np
+import jax.numpy as jnp
+
+import numpyro
+import numpyro.distributions as dist
+from numpyro import handlers
+
+
+class Model:
+    max_plate_nesting = 1
+
+    def __init__(self, data):
+        for key, value in data.items():
+            key = key.lower()
+            if isinstance(value, (list, np.ndarray)):
+                if key in ["which_valid_res"]:
+                    # to use as index, array type has to be int
+                    value = jnp.asarray(value, dtype=jnp.int64)
+                elif key in ["coef_prior_list"]:
+                    pass
+                else:
+                    # loc/scale cannot be in int format
+                    # sometimes they may be supplied as int, so dtype conversion is needed
+                    value = jnp.asarray(value, dtype=jnp.float64)
+            self.__dict__[key] = value
+
+    def __call__(self):
+        """
+        Notes
+        -----
+        This mirrors :class:`orbit.pyro.ktr.Model` with numpyro primitives. Derived quantities are
+        registered as `numpyro.deterministic` sites so they can be extracted along with the latent
+        variables.
+        """
+
+        response = self.response
+        which_valid = self.which_valid_res
+
+        n_obs = self.num_of_obs
+        sdy = self.response_sd
+        meany = self.mean_y
+        dof = self.dof
+        lev_knot_loc = self.lev_knot_loc
+        seas_term = self.seas_term
+        # added for tempured sampling
+        T = self.t_star
+
+        pr = self.pr
+        nr = self.nr
+        rr = self.rr
+        n_pr = self.n_pr
+        n_rr = self.n_rr
+        n_nr = self.n_nr
+
+        k_lev = self.k_lev
+        k_coef = self.k_coef
+        n_knots_lev = self.n_knots_lev
+        n_knots_coef = self.n_knots_coef
+
+        lev_knot_scale = self.lev_knot_scale
+
+        resid_scale_ub = self.resid_scale_ub
+        if resid_scale_ub > sdy:
+            resid_scale_ub = sdy
+
+        rr_init_knot_loc = self.rr_init_knot_loc
+        rr_init_knot_scale = self.rr_init_knot_scale
+        rr_knot_scale = self.rr_knot_scale
+
+        pr_init_knot_loc = self.pr_init_knot_loc
+        pr_init_knot_scale = self.pr_init_knot_scale
+        pr_knot_scale = self.pr_knot_scale
+        nr_init_knot_loc = self.nr_init_knot_loc
+        nr_init_knot_scale = self.nr_init_knot_scale
+        nr_knot_scale = self.nr_knot_scale
+
+        # prepare regressor matrix
+        regressors = jnp.concatenate(
+            [
+                rr.reshape(n_obs, n_rr),
+                pr.reshape(n_obs, n_pr),
+                nr.reshape(n_obs, n_nr),
+            ],
+            axis=-1,
+        )
+        if n_pr == 0 and n_nr == 0 and n_rr == 0:
+            regressors = jnp.zeros(n_obs)
+
+        response_tran = response - meany - seas_term
+
+        # levels sampling
+        lev_knot_tran = numpyro.sample(
+            "lev_knot_tran",
+            dist.Normal(lev_knot_loc - meany, lev_knot_scale)
+            .expand([n_knots_lev])
+            .to_event(1),
+        )
+        lev = lev_knot_tran @ jnp.swapaxes(k_lev, -2, -1)
+
+        coef_init_knot_list = list()
+        coef_knot_list = list()
+        coef_list = list()
+        # regular regressor sampling
+        if n_rr > 0:
+            # pooling latent variables
+            rr_init_knot = numpyro.sample(
+                "rr_init_knot",
+                dist.Normal(rr_init_knot_loc, rr_init_knot_scale).to_event(1),
+            )
+            rr_knot = numpyro.sample(
+                "rr_knot",
+                dist.Normal(
+                    jnp.expand_dims(rr_init_knot, -1) * jnp.ones((n_rr, n_knots_coef)),
+                    rr_knot_scale,
+                ).to_event(2),
+            )
+            rr_coef = jnp.swapaxes(rr_knot @ jnp.swapaxes(k_coef, -2, -1), -2, -1)
+            coef_init_knot_list.append(rr_init_knot)
+            coef_knot_list.append(rr_knot)
+            coef_list.append(rr_coef)
+
+        # positive regressor sampling
+        if n_pr > 0:
+            # pooling latent variables
+            pr_init_knot = numpyro.sample(
+                "pr_knot_loc",
+                dist.FoldedDistribution(
+                    dist.Normal(pr_init_knot_loc, pr_init_knot_scale)
+                ).to_event(1),
+            )
+            pr_knot = numpyro.sample(
+                "pr_knot",
+                dist.FoldedDistribution(
+                    dist.Normal(
+                        jnp.expand_dims(pr_init_knot, -1)
+                        * jnp.ones((n_pr, n_knots_coef)),
+                        pr_knot_scale,
+                    )
+                ).to_event(2),
+            )
+            pr_coef = jnp.swapaxes(pr_knot @ jnp.swapaxes(k_coef, -2, -1), -2, -1)
+            coef_init_knot_list.append(pr_init_knot)
+            coef_knot_list.append(pr_knot)
+            coef_list.append(pr_coef)
+
+        # negative regressor sampling
+        if n_nr > 0:
+            # pooling latent variables
+            nr_init_knot = -1.0 * numpyro.sample(
+                "nr_knot_loc",
+                dist.FoldedDistribution(
+                    dist.Normal(nr_init_knot_loc, nr_init_knot_scale)
+                ).to_event(1),
+            )
+            nr_knot = -1.0 * numpyro.sample(
+                "nr_knot",
+                dist.FoldedDistribution(
+                    dist.Normal(
+                        jnp.expand_dims(nr_init_knot, -1)
+                        * jnp.ones((n_nr, n_knots_coef)),
+                        nr_knot_scale,
+                    )
+                ).to_event(2),
+            )
+            nr_coef = jnp.swapaxes(nr_knot @ jnp.swapaxes(k_coef, -2, -1), -2, -1)
+            coef_init_knot_list.append(nr_init_knot)
+            coef_knot_list.append(nr_knot)
+            coef_list.append(nr_coef)
+
+        if n_pr == 0 and n_nr == 0 and n_rr == 0:
+            coef = jnp.zeros(n_obs)
+        else:
+            coef_init_knot = jnp.concatenate(coef_init_knot_list, axis=-1)
+            coef_knot = jnp.concatenate(coef_knot_list, axis=-2)
+            coef = jnp.concatenate(coef_list, axis=-1)
+            numpyro.deterministic("coef_init_knot", coef_init_knot)
+            numpyro.deterministic("coef_knot", coef_knot)
+
+        # coefficients likelihood/priors
+        coef_prior_list = self.coef_prior_list
+        if coef_prior_list:
+            for x in coef_prior_list:
+                name = x["name"]
+                m = jnp.asarray(x["prior_mean"])
+                sd = jnp.asarray(x["prior_sd"])
+                start_tp_idx = x["prior_start_tp_idx"]
+                end_tp_idx = x["prior_end_tp_idx"]
+                idx = jnp.asarray(x["prior_regressor_col_idx"])
+                numpyro.sample(
+                    "prior_{}".format(name),
+                    dist.Normal(m, sd).to_event(2),
+                    obs=coef[..., start_tp_idx:end_tp_idx, idx],
+                )
+
+        # observation likelihood
+        yhat = lev + (regressors * coef).sum(-1)
+        # set lower and upper bound of scale parameter
+        # Beta(5, 1) set up some gravity to ask for extra evidence to reduce the scale sharply
+        obs_scale_base = jnp.expand_dims(
+            numpyro.sample("obs_scale_base", dist.Beta(5, 1)), -1
+        )
+        obs_scale = obs_scale_base * resid_scale_ub
+
+        # this line addes a tempurature to the obs fit
+        with handlers.scale(scale=1.0 / T):
+            numpyro.sample(
+                "response",
+                dist.StudentT(dof, yhat[..., which_valid], obs_scale).to_event(1),
+                obs=response_tran[which_valid],
+            )
+
+        log_prob = dist.StudentT(dof, yhat[..., which_valid], obs_scale).log_prob(
+            response_tran[which_valid]
+        )
+
+        lev_knot = lev_knot_tran + meany
+
+        numpyro.deterministic("yhat", yhat + seas_term + meany)
+        numpyro.deterministic("lev", lev + meany)
+        numpyro.deterministic("lev_knot", lev_knot)
+        numpyro.deterministic("coef", coef)
+        numpyro.deterministic("obs_scale", obs_scale)
+        numpyro.deterministic("log_prob", log_prob)
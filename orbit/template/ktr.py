@@ -3,10 +3,10 @@ import pandas as pd
 import numpy as np
 import math
 from scipy.stats import nct
+from collections import OrderedDict
 from enum import Enum
 import torch
 import matplotlib.pyplot as plt
-from copy import deepcopy
 
 from ..constants.constants import (
     KTRTimePointPriorKeys,
@@ -16,13 +16,15 @@ from ..constants.constants import (
 )
 from ..exceptions import IllegalArgument, ModelException, PredictionException
 from ..utils.general import is_ordered_datetime
-from ..utils.kernels import gauss_kernel, sandwich_kernel
+from ..utils.kernels import gauss_kernel, sandwich_kernel, _sparse_kernel_matmul_numba
+from ..utils.jit import NUMBA_INSTALLED
 from ..utils.features import make_seasonal_regressors
 from .model_template import ModelTemplate
 from ..estimators.pyro_estimator import PyroEstimatorSVI
+from ..estimators.numpyro_estimator import NumPyroEstimatorSVI
 from ..models import KTRLite
 from orbit.constants.palette import OrbitPalette
-from ..utils.knots import get_knot_idx, get_knot_dates
+from ..utils.knots import get_knot_idx, get_knot_dates, get_knot_scale_multiplier
 from ..utils.plot import orbit_style_decorator
 
 
@@ -95,10 +97,30 @@ DEFAULT_COEFFICIENTS_INIT_KNOT_LOC = 0
 DEFAULT_COEFFICIENTS_KNOT_SCALE = 0.1
 DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER = 0.01
 DEFAULT_UPPER_BOUND_SCALE_MULTIPLIER = 1.0
+# minimum number of posterior samples to compute the trend with the jit-compiled kernel
+JIT_TREND_MIN_NUM_OF_SAMPLES = 1000
+# maximum number of entries kept in each of the prediction caches
+MAX_PREDICTION_CACHE_SIZE = 4
+
+
+def _get_cached(cache, key):
+    """Return the cached value of `key` or None, marking it as the most recently used entry"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _set_cached(cache, key, value):
+    """Store `value` under `key` and evict the least recently used entries beyond the cache size"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_PREDICTION_CACHE_SIZE:
+        cache.popitem(last=False)
 
 
 class KTRModel(ModelTemplate):
-    """Base KTR model object with shared functionality for PyroVI method
+    """Base KTR model object with shared functionality for PyroVI and NumPyroVI method
     Parameters
     ----------
     level_knot_scale : float
@@ -145,19 +167,23 @@ class KTRModel(ModelTemplate):
     coef_prior_list : list of dicts
         each dict in the list should have keys as
         'name', prior_start_tp_idx' (inclusive), KTRTimePointPriorKeys.PRIOR_END_TP_IDX.value (not inclusive),
-        KTRTimePointPriorKeys.PRIOR_MEAN.value, KTRTimePointPriorKeys.PRIOR_SD.value, and KTRTimePointPriorKeys.PRIOR_REGRESSOR_COL.value
+        KTRTimePointPriorKeys.PRIOR_MEAN.value, KTRTimePointPriorKeys.PRIOR_SD.value, and KTRTimePointPriorKeys.PRIOR_REGRESSOR_COL.value;
+        the dicts are copied but their values are shared references and should not be mutated after passing
     residuals_scale_upper : float
     flat_multiplier : bool
         Default set as True. If False, we will adjust knot scale with a multiplier based on regressor volume
         around each knot; When True, set all multiplier as 1
     ktrlite_optim_args : dict
         the optimizing config for the ktrlite model (to fit level/seasonality). Default to be dict().
+    float32_prediction : bool
+        Default set as False. If True, the trend and regression products in prediction are computed in float32 to
+        reduce memory bandwidth with long horizons or many posterior samples; fitting is not affected
     """
 
     _data_input_mapper = DataInputMapper
     # stan or pyro model name (e.g. name of `*.stan` file in package)
     _model_name = "ktr"
-    _supported_estimator_types = [PyroEstimatorSVI]
+    _supported_estimator_types = [PyroEstimatorSVI, NumPyroEstimatorSVI]
 
     def __init__(
         self,
@@ -190,6 +216,7 @@ class KTRModel(ModelTemplate):
         flat_multiplier=True,
         residuals_scale_upper=None,
         ktrlite_optim_args=dict(),
+        float32_prediction=False,
         **kwargs,
     ):
         super().__init__(**kwargs)  # create estimator in base class
@@ -274,6 +301,17 @@ class KTRModel(ModelTemplate):
         # the following are set by `_set_dynamic_attributes()` and generally set during fit()
         # from input df
         # response data
+        # map training date to its time index; set by `_set_training_date_index()`
+        self._training_date_to_idx = None
+        # inferred date frequency cached by training range when date_freq is not supplied
+        self._date_freq = None
+        self._date_freq_key = None
+        # seasonal fourier regressors of recent predictions cached by prediction range and seasonality;
+        # reset on every fit
+        self._seas_cache = OrderedDict()
+        # regression coefficient kernels of recent out-of-sample ranges cached by (start, length) of
+        # prediction; reset on every fit
+        self._kernel_coef_cache = OrderedDict()
         self._is_valid_response = None
         self._which_valid_response = None
         self._num_of_valid_response = 0
@@ -290,6 +328,7 @@ class KTRModel(ModelTemplate):
         self.residuals_scale_upper = residuals_scale_upper
         self._residuals_scale_upper = residuals_scale_upper
         self.ktrlite_optim_args = ktrlite_optim_args
+        self.float32_prediction = float32_prediction
 
         self._set_static_attributes()
         self._set_model_param_names()
@@ -307,7 +346,8 @@ class KTRModel(ModelTemplate):
         # default checks for seasonality and seasonality_fs_order will be conducted
         # in ktrlite model and we will extract them from ktrlite model directly later
         if self.coef_prior_list is not None:
-            self._coef_prior_list = deepcopy(self.coef_prior_list)
+            # only top-level keys are replaced downstream; a copy of each dict is sufficient
+            self._coef_prior_list = [dict(d) for d in self.coef_prior_list]
 
         # if no regressors, end here #
         if self.regressor_col is None:
@@ -365,83 +405,51 @@ class KTRModel(ModelTemplate):
         if self._num_of_regressors == 0:
             return
 
-        for index, reg_sign in enumerate(self._regressor_sign):
-            if reg_sign == "+":
-                self._num_of_positive_regressors += 1
-                self._positive_regressor_col.append(self.regressor_col[index])
-                # used for 'pr_knot_loc' sampling in pyro
-                self._positive_regressor_init_knot_loc.append(
-                    self._regressor_init_knot_loc[index]
-                )
-                self._positive_regressor_init_knot_scale.append(
-                    self._regressor_init_knot_scale[index]
-                )
-                # used for 'pr_knot' sampling in pyro
-                self._positive_regressor_knot_scale_1d.append(
-                    self._regressor_knot_scale[index]
-                )
-            elif reg_sign == "-":
-                self._num_of_negative_regressors += 1
-                self._negative_regressor_col.append(self.regressor_col[index])
-                # used for 'nr_knot_loc' sampling in pyro
-                self._negative_regressor_init_knot_loc.append(
-                    self._regressor_init_knot_loc[index]
-                )
-                self._negative_regressor_init_knot_scale.append(
-                    self._regressor_init_knot_scale[index]
-                )
-                # used for 'nr_knot' sampling in pyro
-                self._negative_regressor_knot_scale_1d.append(
-                    self._regressor_knot_scale[index]
-                )
-            else:
-                self._num_of_regular_regressors += 1
-                self._regular_regressor_col.append(self.regressor_col[index])
-                # used for 'rr_knot_loc' sampling in pyro
-                self._regular_regressor_init_knot_loc.append(
-                    self._regressor_init_knot_loc[index]
-                )
-                self._regular_regressor_init_knot_scale.append(
-                    self._regressor_init_knot_scale[index]
-                )
-                # used for 'rr_knot' sampling in pyro
-                self._regular_regressor_knot_scale_1d.append(
-                    self._regressor_knot_scale[index]
-                )
+        signs = np.asarray(self._regressor_sign)
+        init_knot_loc = np.asarray(self._regressor_init_knot_loc, dtype=np.double)
+        init_knot_scale = np.asarray(self._regressor_init_knot_scale, dtype=np.double)
+        knot_scale = np.asarray(self._regressor_knot_scale, dtype=np.double)
+
+        positive_mask = signs == "+"
+        negative_mask = signs == "-"
+        regular_mask = ~(positive_mask | negative_mask)
+
+        self._num_of_positive_regressors = int(positive_mask.sum())
+        self._positive_regressor_col = [
+            col for col, m in zip(self.regressor_col, positive_mask) if m
+        ]
+        # used for 'pr_knot_loc' sampling in pyro
+        self._positive_regressor_init_knot_loc = init_knot_loc[positive_mask]
+        self._positive_regressor_init_knot_scale = init_knot_scale[positive_mask]
+        # used for 'pr_knot' sampling in pyro
+        self._positive_regressor_knot_scale_1d = knot_scale[positive_mask]
+
+        self._num_of_negative_regressors = int(negative_mask.sum())
+        self._negative_regressor_col = [
+            col for col, m in zip(self.regressor_col, negative_mask) if m
+        ]
+        # used for 'nr_knot_loc' sampling in pyro
+        self._negative_regressor_init_knot_loc = init_knot_loc[negative_mask]
+        self._negative_regressor_init_knot_scale = init_knot_scale[negative_mask]
+        # used for 'nr_knot' sampling in pyro
+        self._negative_regressor_knot_scale_1d = knot_scale[negative_mask]
+
+        self._num_of_regular_regressors = int(regular_mask.sum())
+        self._regular_regressor_col = [
+            col for col, m in zip(self.regressor_col, regular_mask) if m
+        ]
+        # used for 'rr_knot_loc' sampling in pyro
+        self._regular_regressor_init_knot_loc = init_knot_loc[regular_mask]
+        self._regular_regressor_init_knot_scale = init_knot_scale[regular_mask]
+        # used for 'rr_knot' sampling in pyro
+        self._regular_regressor_knot_scale_1d = knot_scale[regular_mask]
+
         # regular first, then positive, then negative
         self._regressor_col = (
             self._regular_regressor_col
             + self._positive_regressor_col
             + self._negative_regressor_col
         )
-        # numpy conversion
-        self._positive_regressor_init_knot_loc = np.array(
-            self._positive_regressor_init_knot_loc
-        )
-        self._positive_regressor_init_knot_scale = np.array(
-            self._positive_regressor_init_knot_scale
-        )
-        self._positive_regressor_knot_scale_1d = np.array(
-            self._positive_regressor_knot_scale_1d
-        )
-        self._negative_regressor_init_knot_loc = np.array(
-            self._negative_regressor_init_knot_loc
-        )
-        self._negative_regressor_init_knot_scale = np.array(
-            self._negative_regressor_init_knot_scale
-        )
-        self._negative_regressor_knot_scale_1d = np.array(
-            self._negative_regressor_knot_scale_1d
-        )
-        self._regular_regressor_init_knot_loc = np.array(
-            self._regular_regressor_init_knot_loc
-        )
-        self._regular_regressor_init_knot_scale = np.array(
-            self._regular_regressor_init_knot_scale
-        )
-        self._regular_regressor_knot_scale_1d = np.array(
-            self._regular_regressor_knot_scale_1d
-        )
 
     @staticmethod
     def _validate_coef_prior(coef_prior_list):
@@ -477,11 +485,17 @@ class KTRModel(ModelTemplate):
 
     def _set_coef_prior_idx(self):
         if self._coef_prior_list and len(self._regressor_col) > 0:
+            col_to_idx = {col: idx for idx, col in enumerate(self._regressor_col)}
             for x in self._coef_prior_list:
-                prior_regressor_col_idx = [
-                    np.where(np.array(self._regressor_col) == col)[0][0]
-                    for col in x[KTRTimePointPriorKeys.PRIOR_REGRESSOR_COL.value]
-                ]
+                try:
+                    prior_regressor_col_idx = [
+                        col_to_idx[col]
+                        for col in x[KTRTimePointPriorKeys.PRIOR_REGRESSOR_COL.value]
+                    ]
+                except KeyError as e:
+                    raise IllegalArgument(
+                        "prior_regressor_col {} is not found in regressor_col".format(e)
+                    )
                 x.update({"prior_regressor_col_idx": prior_regressor_col_idx})
 
     def _set_static_attributes(self):
@@ -495,28 +509,43 @@ class KTRModel(ModelTemplate):
             self._validate_coef_prior(self._coef_prior_list)
             self._set_coef_prior_idx()
 
+    def _set_training_date_index(self, training_meta):
+        """Build a hash map from training date to its time index for O(1) lookups at prediction"""
+        date_array = training_meta[TrainingMetaKeys.DATE_ARRAY.value]
+        self._training_date_to_idx = {
+            date: idx for idx, date in enumerate(pd.DatetimeIndex(date_array))
+        }
+
+    def _get_training_date_idx(self, date):
+        """Return the time index of a training date; raise KeyError if the date is not found"""
+        return self._training_date_to_idx[pd.Timestamp(date)]
+
     def _set_valid_response_attributes(self, training_meta):
         num_of_observations = training_meta[TrainingMetaKeys.NUM_OF_OBS.value]
         response = training_meta[TrainingMetaKeys.RESPONSE.value]
 
+        max_seasonality = None
         if self._seasonality:
-            max_seasonality = np.round(np.max(self._seasonality)).astype(int)
+            max_seasonality = int(round(max(self._seasonality)))
             if num_of_observations < max_seasonality:
                 raise ModelException(
                     "Number of observations {} is less than max seasonality {}".format(
                         num_of_observations, max_seasonality
                     )
                 )
+
+        nan_mask = np.isnan(response)
         # get some reasonable offset to regularize response to make default priors scale-insensitive
-        if self._seasonality:
-            max_seasonality = np.round(np.max(self._seasonality)).astype(int)
-            self.response_offset = np.nanmean(response[:max_seasonality])
+        offset_response = (
+            response[:max_seasonality] if max_seasonality is not None else response
+        )
+        if nan_mask.any():
+            self.response_offset = np.nanmean(offset_response)
         else:
-            self.response_offset = np.nanmean(response)
+            self.response_offset = offset_response.mean()
 
-        self.is_valid_response = ~np.isnan(response)
-        # [0] to convert tuple back to array
-        self.which_valid_response = np.where(self.is_valid_response)[0]
+        self.is_valid_response = ~nan_mask
+        self.which_valid_response = np.flatnonzero(self.is_valid_response)
         self.num_of_valid_response = len(self.which_valid_response)
 
     def _set_regressor_matrix(self, df, training_meta):
@@ -541,20 +570,22 @@ class KTRModel(ModelTemplate):
         )
 
         # update regression matrices
+        # store them in column-major order since the knot scale reductions are done per regressor;
+        # keep float64 as pyro casts the inputs to double anyway
         if self._num_of_positive_regressors > 0:
-            self._positive_regressor_matrix = df.filter(
-                items=self._positive_regressor_col,
-            ).values
+            self._positive_regressor_matrix = np.asfortranarray(
+                df[self._positive_regressor_col].to_numpy(dtype=np.double)
+            )
 
         if self._num_of_negative_regressors > 0:
-            self._negative_regressor_matrix = df.filter(
-                items=self._negative_regressor_col,
-            ).values
+            self._negative_regressor_matrix = np.asfortranarray(
+                df[self._negative_regressor_col].to_numpy(dtype=np.double)
+            )
 
         if self._num_of_regular_regressors > 0:
-            self._regular_regressor_matrix = df.filter(
-                items=self._regular_regressor_col,
-            ).values
+            self._regular_regressor_matrix = np.asfortranarray(
+                df[self._regular_regressor_col].to_numpy(dtype=np.double)
+            )
 
     def _set_coefficients_kernel_matrix(self, df, training_meta):
         """Derive knots position and kernel matrix and other related meta data"""
@@ -567,13 +598,17 @@ class KTRModel(ModelTemplate):
         self._num_knots_coefficients = 0
 
         if self._num_of_regressors > 0:
-            self._regression_knots_idx = get_knot_idx(
+            regression_knots_idx = get_knot_idx(
                 date_array=date_array,
                 num_of_obs=num_of_observations,
                 knot_dates=self._regression_knot_dates,
                 knot_distance=self.regression_knot_distance,
                 num_of_segments=self.regression_segments,
             )
+            # keep a contiguous int64 array for the segment reductions and jit-compiled kernels
+            self._regression_knots_idx = np.ascontiguousarray(
+                regression_knots_idx, dtype=np.int64
+            )
 
             tp = np.arange(1, num_of_observations + 1) / num_of_observations
             self._knots_tp_coefficients = (
@@ -583,177 +618,159 @@ class KTRModel(ModelTemplate):
                 tp, self._knots_tp_coefficients, rho=self.regression_rho
             )
             self._num_knots_coefficients = len(self._knots_tp_coefficients)
-            if self.date_freq is None:
-                self.date_freq = pd.infer_freq(date_array)
-                # self.date_timedelta = date_array.diff().min()
             self._regression_knot_dates = get_knot_dates(
-                date_array[0], self._regression_knots_idx, self.date_freq
+                date_array[0],
+                self._regression_knots_idx,
+                self._get_date_freq(training_meta),
+            )
+
+    def _get_date_freq(self, training_meta):
+        """Return the supplied date frequency or the one inferred from the training dates. The inferred
+        frequency is cached by the training start, end and number of observations so refitting on the
+        same range skips the scan over the date array.
+        """
+        if self.date_freq is not None:
+            return self.date_freq
+
+        key = (
+            training_meta[TrainingMetaKeys.START.value],
+            training_meta[TrainingMetaKeys.END.value],
+            training_meta[TrainingMetaKeys.NUM_OF_OBS.value],
+        )
+        if self._date_freq_key != key:
+            self._date_freq = pd.infer_freq(
+                training_meta[TrainingMetaKeys.DATE_ARRAY.value]
             )
+            self._date_freq_key = key
+        return self._date_freq
+
+    def _segment_bounds(self, num_of_obs):
+        """Return the start (inclusive), end (exclusive) and length of each regression segment where a
+        segment starts at its knot and ends at the next knot or the end of the series.
+        """
+        starts = np.asarray(self._regression_knots_idx, dtype=np.int64)
+        ends = np.concatenate([starts[1:], [num_of_obs]]).astype(np.int64)
+        return starts, ends, ends - starts
 
     def _set_knots_scale_matrix(self, df, training_meta):
+        if self._num_of_regressors == 0:
+            return
+
         num_of_observations = training_meta[TrainingMetaKeys.NUM_OF_OBS.value]
+        starts, ends, _ = self._segment_bounds(num_of_observations)
+
         if self._num_of_positive_regressors > 0:
-            # calculate average local absolute volume for each segment
-            local_val = np.ones(
-                (self._num_of_positive_regressors, self._num_knots_coefficients)
-            )
             if self.flat_multiplier:
-                multiplier = np.ones(local_val.shape)
+                multiplier = np.ones(
+                    (self._num_of_positive_regressors, self._num_knots_coefficients)
+                )
             else:
-                multiplier = np.ones(local_val.shape)
-                # store local value for the range on the left side since last knot
-                for idx in range(len(self._regression_knots_idx)):
-                    if idx < len(self._regression_knots_idx) - 1:
-                        str_idx = self._regression_knots_idx[idx]
-                        end_idx = self._regression_knots_idx[idx + 1]
-                    else:
-                        str_idx = self._regression_knots_idx[idx]
-                        end_idx = num_of_observations
-
-                    local_val[:, idx] = np.mean(
-                        np.fabs(self._positive_regressor_matrix[str_idx:end_idx]),
-                        axis=0,
-                    )
-
-                global_mean = np.expand_dims(
-                    np.mean(np.fabs(self._positive_regressor_matrix), axis=0), -1
+                # adjust knot scale with the multiplier derived from the average local absolute volume
+                # of each segment against the global average
+                multiplier = get_knot_scale_multiplier(
+                    self._positive_regressor_matrix,
+                    starts,
+                    ends,
+                    DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER,
                 )
-                test_flag = local_val < 0.01 * global_mean
-
-                # adjust knot scale with the multiplier derive by the average value and shift by 0.001 to avoid zeros in
-                # scale parameters
-                multiplier[test_flag] = DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER
-                # replace entire row of nan (when 0.1 * global_mean is equal to global_min) with upper bound
-                multiplier[np.isnan(multiplier).all(axis=-1)] = 1.0
 
             # geometric drift i.e. 0.1 = 10% up-down in 1 s.d. prob.
             # self._positive_regressor_knot_scale has shape num_of_pr x num_of_knot
-            self._positive_regressor_knot_scale = multiplier * np.expand_dims(
-                self._positive_regressor_knot_scale_1d, -1
+            # multiplier is freshly allocated; scale and keep a lower bound of scale parameters in place
+            np.multiply(
+                multiplier,
+                self._positive_regressor_knot_scale_1d[:, None],
+                out=multiplier,
             )
-            # keep a lower bound of scale parameters
-            self._positive_regressor_knot_scale[
-                self._positive_regressor_knot_scale < 1e-4
-            ] = 1e-4
-            # TODO: we change the type here, maybe we should change it earlier?
-            self._positive_regressor_init_knot_scale = np.array(
-                self._positive_regressor_init_knot_scale
+            np.clip(multiplier, 1e-4, None, out=multiplier)
+            self._positive_regressor_knot_scale = multiplier
+            np.clip(
+                self._positive_regressor_init_knot_scale,
+                1e-4,
+                None,
+                out=self._positive_regressor_init_knot_scale,
             )
-            self._positive_regressor_init_knot_scale[
-                self._positive_regressor_init_knot_scale < 1e-4
-            ] = 1e-4
 
         if self._num_of_negative_regressors > 0:
-            # calculate average local absolute volume for each segment
-            local_val = np.ones(
-                (self._num_of_negative_regressors, self._num_knots_coefficients)
-            )
             if self.flat_multiplier:
-                multiplier = np.ones(local_val.shape)
+                multiplier = np.ones(
+                    (self._num_of_negative_regressors, self._num_knots_coefficients)
+                )
             else:
-                multiplier = np.ones(local_val.shape)
-                # store local value for the range on the left side since last knot
-                for idx in range(len(self._regression_knots_idx)):
-                    if idx < len(self._regression_knots_idx) - 1:
-                        str_idx = self._regression_knots_idx[idx]
-                        end_idx = self._regression_knots_idx[idx + 1]
-                    else:
-                        str_idx = self._regression_knots_idx[idx]
-                        end_idx = num_of_observations
-
-                    local_val[:, idx] = np.mean(
-                        np.fabs(self._negative_regressor_matrix[str_idx:end_idx]),
-                        axis=0,
-                    )
-
-                global_mean = np.expand_dims(
-                    np.mean(np.fabs(self._negative_regressor_matrix), axis=0), -1
+                # adjust knot scale with the multiplier derived from the average local absolute volume
+                # of each segment against the global average
+                multiplier = get_knot_scale_multiplier(
+                    self._negative_regressor_matrix,
+                    starts,
+                    ends,
+                    DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER,
                 )
-                test_flag = local_val < 0.01 * global_mean
-
-                # adjust knot scale with the multiplier derive by the average value and shift by 0.001 to avoid zeros in
-                # scale parameters
-                multiplier[test_flag] = DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER
-                # replace entire row of nan (when 0.1 * global_mean is equal to global_min) with upper bound
-                multiplier[np.isnan(multiplier).all(axis=-1)] = 1.0
 
             # geometric drift i.e. 0.1 = 10% up-down in 1 s.d. prob.
-            self._negative_regressor_knot_scale = multiplier * np.expand_dims(
-                self._negative_regressor_knot_scale_1d, -1
+            # self._negative_regressor_knot_scale has shape num_of_nr x num_of_knot
+            # multiplier is freshly allocated; scale and keep a lower bound of scale parameters in place
+            np.multiply(
+                multiplier,
+                self._negative_regressor_knot_scale_1d[:, None],
+                out=multiplier,
             )
-            # keep a lower bound of scale parameters
-            self._negative_regressor_knot_scale[
-                self._negative_regressor_knot_scale < 1e-4
-            ] = 1e-4
-            # TODO: we change the type here, maybe we should change it earlier?
-            self._negative_regressor_init_knot_scale = np.array(
-                self._negative_regressor_init_knot_scale
+            np.clip(multiplier, 1e-4, None, out=multiplier)
+            self._negative_regressor_knot_scale = multiplier
+            np.clip(
+                self._negative_regressor_init_knot_scale,
+                1e-4,
+                None,
+                out=self._negative_regressor_init_knot_scale,
             )
-            self._negative_regressor_init_knot_scale[
-                self._negative_regressor_init_knot_scale < 1e-4
-            ] = 1e-4
 
         if self._num_of_regular_regressors > 0:
-            # do the same for regular regressor
-            # calculate average local absolute volume for each segment
-            local_val = np.ones(
-                (self._num_of_regular_regressors, self._num_knots_coefficients)
-            )
             if self.flat_multiplier:
-                multiplier = np.ones(local_val.shape)
+                multiplier = np.ones(
+                    (self._num_of_regular_regressors, self._num_knots_coefficients)
+                )
+                # the local average is taken as 1 under the flat multiplier; regular regressors with a global
+                # average absolute volume above 100 still get the lower bound multiplier
+                global_mean = np.mean(np.fabs(self._regular_regressor_matrix), axis=0)
+                multiplier[1.0 < 0.01 * global_mean] = (
+                    DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER
+                )
             else:
-                multiplier = np.ones(local_val.shape)
-                # store local value for the range on the left side since last knot
-                for idx in range(len(self._regression_knots_idx)):
-                    if idx < len(self._regression_knots_idx) - 1:
-                        str_idx = self._regression_knots_idx[idx]
-                        end_idx = self._regression_knots_idx[idx + 1]
-                    else:
-                        str_idx = self._regression_knots_idx[idx]
-                        end_idx = num_of_observations
-
-                    local_val[:, idx] = np.mean(
-                        np.fabs(self._regular_regressor_matrix[str_idx:end_idx]), axis=0
-                    )
-
-            # adjust knot scale with the multiplier derive by the average value and shift by 0.001 to avoid zeros in
-            # scale parameters
-            global_mean = np.expand_dims(
-                np.mean(np.fabs(self._regular_regressor_matrix), axis=0), -1
-            )
-            test_flag = local_val < 0.01 * global_mean
-            multiplier[test_flag] = DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER
-            # replace entire row of nan (when 0.1 * global_mean is equal to global_min) with upper bound
-            multiplier[np.isnan(multiplier).all(axis=-1)] = 1.0
+                # adjust knot scale with the multiplier derived from the average local absolute volume
+                # of each segment against the global average
+                multiplier = get_knot_scale_multiplier(
+                    self._regular_regressor_matrix,
+                    starts,
+                    ends,
+                    DEFAULT_LOWER_BOUND_SCALE_MULTIPLIER,
+                )
 
             # geometric drift i.e. 0.1 = 10% up-down in 1 s.d. prob.
-            # self._regular_regressor_knot_scale has shape num_of_pr x num_of_knot
-            self._regular_regressor_knot_scale = multiplier * np.expand_dims(
-                self._regular_regressor_knot_scale_1d, -1
+            # self._regular_regressor_knot_scale has shape num_of_rr x num_of_knot
+            # multiplier is freshly allocated; scale and keep a lower bound of scale parameters in place
+            np.multiply(
+                multiplier,
+                self._regular_regressor_knot_scale_1d[:, None],
+                out=multiplier,
             )
-            # keep a lower bound of scale parameters
-            self._regular_regressor_knot_scale[
-                self._regular_regressor_knot_scale < 1e-4
-            ] = 1e-4
-            # TODO: we change the type here, maybe we should change it earlier?
-            self._regular_regressor_init_knot_scale = np.array(
-                self._regular_regressor_init_knot_scale
+            np.clip(multiplier, 1e-4, None, out=multiplier)
+            self._regular_regressor_knot_scale = multiplier
+            np.clip(
+                self._regular_regressor_init_knot_scale,
+                1e-4,
+                None,
+                out=self._regular_regressor_init_knot_scale,
             )
-            self._regular_regressor_init_knot_scale[
-                self._regular_regressor_init_knot_scale < 1e-4
-            ] = 1e-4
 
     def _generate_tp(self, training_meta, prediction_date_array):
         """Used in _generate_seas"""
         training_end = training_meta[TrainingMetaKeys.END.value]
         num_of_observations = training_meta[TrainingMetaKeys.NUM_OF_OBS.value]
-        date_array = training_meta[TrainingMetaKeys.DATE_ARRAY.value]
         prediction_start = prediction_date_array[0]
         output_len = len(prediction_date_array)
         if prediction_start > training_end:
             start = num_of_observations
         else:
-            start = pd.Index(date_array).get_loc(prediction_start)
+            start = self._get_training_date_idx(prediction_start)
 
         new_tp = np.arange(start + 1, start + output_len + 1) / num_of_observations
         return new_tp
@@ -762,18 +779,16 @@ class KTRModel(ModelTemplate):
         """Used in _generate_seas"""
         train_date_array = training_meta[TrainingMetaKeys.DATE_ARRAY.value]
         num_of_observations = training_meta[TrainingMetaKeys.NUM_OF_OBS.value]
-        idx = np.nonzero(np.in1d(train_date_array, date_array))[0]
+        # training dates are ordered and unique; only keep the exact matches
+        train_dates = pd.DatetimeIndex(train_date_array).values
+        dates = pd.DatetimeIndex(date_array).values
+        idx = np.searchsorted(train_dates, dates)
+        is_match = idx < num_of_observations
+        is_match[is_match] = train_dates[idx[is_match]] == dates[is_match]
+        idx = np.unique(idx[is_match])
         tp = (idx + 1) / num_of_observations
         return tp
 
-    # def _generate_coefs(self, training_meta, prediction_date_array, coef_knot_dates, coef_knot):
-    #     """Used in _generate_seas"""
-    #     new_tp = self._generate_tp(training_meta, prediction_date_array)
-    #     knots_tp_coef = self._generate_insample_tp(training_meta, coef_knot_dates)
-    #     kernel_coef = sandwich_kernel(new_tp, knots_tp_coef)
-    #     coefs = np.squeeze(np.matmul(coef_knot, kernel_coef.transpose(1, 0)), axis=0).transpose(1, 0)
-    #     return coefs
-
     def _generate_seas(
         self,
         df,
@@ -805,14 +820,13 @@ class KTRModel(ModelTemplate):
         dict :
             a dictionary contains seasonal regression components mapped by each seasonality
         """
-        df = df.copy()
+        # df is only read here; no copy is needed
         # store each component as a dictionary
         seas_decomp = dict()
 
         if seasonality is not None and len(seasonality) > 0:
 
             date_col = training_meta[TrainingMetaKeys.DATE_COL.value]
-            date_array = training_meta[TrainingMetaKeys.DATE_ARRAY.value]
             training_end = training_meta[TrainingMetaKeys.END.value]
             num_of_observations = training_meta[TrainingMetaKeys.NUM_OF_OBS.value]
 
@@ -824,16 +838,27 @@ class KTRModel(ModelTemplate):
                 start = num_of_observations
             else:
                 # time index for prediction start
-                start = pd.Index(date_array).get_loc(prediction_start)
-
-            # dictionary
-            seas_regressors = make_seasonal_regressors(
-                n=df.shape[0],
-                periods=seasonality,
-                orders=seasonality_fs_order,
-                labels=seasonality_labels,
-                shift=start,
+                start = self._get_training_date_idx(prediction_start)
+
+            # dictionary; the regressors only depend on the position and length of the prediction and the
+            # seasonality specification
+            seas_key = (
+                start,
+                df.shape[0],
+                tuple(seasonality),
+                tuple(seasonality_fs_order),
+                tuple(seasonality_labels),
             )
+            seas_regressors = _get_cached(self._seas_cache, seas_key)
+            if seas_regressors is None:
+                seas_regressors = make_seasonal_regressors(
+                    n=df.shape[0],
+                    periods=seasonality,
+                    orders=seasonality_fs_order,
+                    labels=seasonality_labels,
+                    shift=start,
+                )
+                _set_cached(self._seas_cache, seas_key, seas_regressors)
 
             new_tp = self._generate_tp(training_meta, prediction_date_array)
             knots_tp_coef = self._generate_insample_tp(training_meta, coef_knot_dates)
@@ -846,10 +871,12 @@ class KTRModel(ModelTemplate):
                 seas_regresor_matrix = seas_regressors[k]
                 coef_knot = coef_knots[k]
                 # time-step x coefficients
-                seas_coef = np.squeeze(
-                    np.matmul(coef_knot, coef_kernel.transpose(1, 0)), axis=0
-                ).transpose(1, 0)
-                seas_regression = np.sum(seas_coef * seas_regresor_matrix, axis=-1)
+                seas_coef = np.einsum(
+                    "kn,tn->tk", np.squeeze(coef_knot, 0), coef_kernel, optimize=True
+                )
+                seas_regression = np.einsum(
+                    "tk,tk->t", seas_coef, seas_regresor_matrix, optimize=True
+                )
                 seas_decomp[k] = np.expand_dims(seas_regression, 0)
                 total_seas_regression += seas_regression
         else:
@@ -877,7 +904,8 @@ class KTRModel(ModelTemplate):
             seasonal_knot_scale=self.seasonal_knot_scale,
             seasonality_segments=self.seasonality_segments,
             degree_of_freedom=self.degree_of_freedom,
-            date_freq=self.date_freq,
+            # share the supplied or cached inferred frequency so KTRLite skips its own inference
+            date_freq=self._get_date_freq(training_meta),
             estimator="stan-map",
             **self.ktrlite_optim_args,
         )
@@ -903,16 +931,7 @@ class KTRModel(ModelTemplate):
         self._level_knots = np.squeeze(ktrlite_pt_posteriors["map"]["lev_knot"])
         self._level_knot_dates = ktrlite._model._level_knot_dates
         tp = np.arange(1, num_of_observations + 1) / num_of_observations
-        # # trim level knots dates when they are beyond training dates
-        # lev_knot_dates = list()
-        # lev_knots = list()
-        # for i, x in enumerate(self.level_knot_dates):
-        #     if (x <= df[date_col].max()) and (x >= df[date_col].min()):
-        #         lev_knot_dates.append(x)
-        #         lev_knots.append(self._level_knots[i])
-        # self._level_knot_dates = pd.to_datetime(lev_knot_dates)
-        # self._level_knots = np.array(lev_knots)
-
+        # level knot dates beyond training dates are already trimmed by `get_knot_idx()` in KTRLite
         self._level_knots_idx = get_knot_idx(
             date_array=date_array,
             num_of_obs=None,
@@ -950,54 +969,60 @@ class KTRModel(ModelTemplate):
 
     def _filter_coef_prior(self, df):
         if self._coef_prior_list and len(self._regressor_col) > 0:
-            # iterate over a copy due to the removal operation
-            for test_dict in self._coef_prior_list[:]:
-                prior_regressor_col = test_dict[
-                    KTRTimePointPriorKeys.PRIOR_REGRESSOR_COL.value
-                ]
-                m = test_dict[KTRTimePointPriorKeys.PRIOR_MEAN.value]
-                sd = test_dict[KTRTimePointPriorKeys.PRIOR_SD.value]
-                end_tp_idx = min(
-                    test_dict[KTRTimePointPriorKeys.PRIOR_END_TP_IDX.value], df.shape[0]
+            num_of_obs = df.shape[0]
+            # clip the time ranges of all priors at once and drop the ones outside of the input
+            start_tp_idx = np.minimum(
+                [
+                    x[KTRTimePointPriorKeys.PRIOR_START_TP_IDX.value]
+                    for x in self._coef_prior_list
+                ],
+                num_of_obs,
+            )
+            end_tp_idx = np.minimum(
+                [
+                    x[KTRTimePointPriorKeys.PRIOR_END_TP_IDX.value]
+                    for x in self._coef_prior_list
+                ],
+                num_of_obs,
+            )
+            is_valid = start_tp_idx < end_tp_idx
+
+            coef_prior_list = list()
+            for test_dict, start, end, valid in zip(
+                self._coef_prior_list, start_tp_idx, end_tp_idx, is_valid
+            ):
+                if not valid:
+                    # removing invalid prior
+                    continue
+                expected_shape = (
+                    end - start,
+                    len(test_dict[KTRTimePointPriorKeys.PRIOR_REGRESSOR_COL.value]),
                 )
-                start_tp_idx = min(
-                    test_dict[KTRTimePointPriorKeys.PRIOR_START_TP_IDX.value],
-                    df.shape[0],
+                test_dict.update(
+                    {
+                        KTRTimePointPriorKeys.PRIOR_START_TP_IDX.value: int(start),
+                        KTRTimePointPriorKeys.PRIOR_END_TP_IDX.value: int(end),
+                        # mean/sd expanding as read-only views instead of filled copies
+                        KTRTimePointPriorKeys.PRIOR_MEAN.value: np.broadcast_to(
+                            test_dict[KTRTimePointPriorKeys.PRIOR_MEAN.value],
+                            expected_shape,
+                        ),
+                        KTRTimePointPriorKeys.PRIOR_SD.value: np.broadcast_to(
+                            test_dict[KTRTimePointPriorKeys.PRIOR_SD.value],
+                            expected_shape,
+                        ),
+                    }
                 )
-                if start_tp_idx < end_tp_idx:
-                    expected_shape = (
-                        end_tp_idx - start_tp_idx,
-                        len(prior_regressor_col),
-                    )
-                    test_dict.update(
-                        {KTRTimePointPriorKeys.PRIOR_END_TP_IDX.value: end_tp_idx}
-                    )
-                    test_dict.update(
-                        {KTRTimePointPriorKeys.PRIOR_START_TP_IDX.value: start_tp_idx}
-                    )
-                    # mean/sd expanding
-                    test_dict.update(
-                        {
-                            KTRTimePointPriorKeys.PRIOR_MEAN.value: np.full(
-                                expected_shape, m
-                            )
-                        }
-                    )
-                    test_dict.update(
-                        {
-                            KTRTimePointPriorKeys.PRIOR_SD.value: np.full(
-                                expected_shape, sd
-                            )
-                        }
-                    )
-                else:
-                    # removing invalid prior
-                    self._coef_prior_list.remove(test_dict)
+                coef_prior_list.append(test_dict)
+            self._coef_prior_list = coef_prior_list
 
     def set_dynamic_attributes(self, df, training_meta):
         """Overriding: func: `~orbit.models.BaseETS._set_dynamic_attributes"""
+        self._set_training_date_index(training_meta)
+        self._seas_cache = OrderedDict()
         self._set_regressor_matrix(df, training_meta)
         self._set_coefficients_kernel_matrix(df, training_meta)
+        self._kernel_coef_cache = OrderedDict()
         self._set_knots_scale_matrix(df, training_meta)
         self._set_levs_and_seas(df, training_meta)
         self._filter_coef_prior(df)
@@ -1058,8 +1083,8 @@ class KTRModel(ModelTemplate):
         ################################################################
         # Model Attributes
         ################################################################
-        # FIXME: do we still need this?
-        model = deepcopy(posterior_estimates)
+        # posteriors are only read below; no copy is needed
+        model = posterior_estimates
         arbitrary_posterior_value = list(model.values())[0]
         num_sample = arbitrary_posterior_value.shape[0]
 
@@ -1068,7 +1093,6 @@ class KTRModel(ModelTemplate):
         ################################################################
         output_len = prediction_meta[PredictionMetaKeys.PREDICTION_DF_LEN.value]
         prediction_start = prediction_meta[PredictionMetaKeys.START.value]
-        date_array = training_meta[TrainingMetaKeys.DATE_ARRAY.value]
         num_of_observations = training_meta[TrainingMetaKeys.NUM_OF_OBS.value]
         training_end = training_meta[TrainingMetaKeys.END.value]
 
@@ -1079,7 +1103,7 @@ class KTRModel(ModelTemplate):
             # time index for prediction start
             start = num_of_observations
         else:
-            start = pd.Index(date_array).get_loc(prediction_start)
+            start = self._get_training_date_idx(prediction_start)
 
         new_tp = np.arange(start + 1, start + output_len + 1) / num_of_observations
         if include_error:
@@ -1096,25 +1120,31 @@ class KTRModel(ModelTemplate):
                 new_knots_tp_level = np.concatenate(
                     [self.knots_tp_level, knots_tp_level_out]
                 )
-                lev_knot_out = np.random.laplace(
+                # fill in-sample and simulated knots into a single buffer and accumulate the
+                # random walk in place starting from the last in-sample knot
+                num_of_knots_in = lev_knot_in.shape[1]
+                lev_knot = np.empty(
+                    (lev_knot_in.shape[0], num_of_knots_in + len(knots_tp_level_out))
+                )
+                lev_knot[:, :num_of_knots_in] = lev_knot_in
+                lev_knot[:, num_of_knots_in:] = np.random.laplace(
                     0,
                     self.level_knot_scale,
                     size=(lev_knot_in.shape[0], len(knots_tp_level_out)),
                 )
-                lev_knot_out = np.cumsum(
-                    np.concatenate(
-                        [lev_knot_in[:, -1].reshape(-1, 1), lev_knot_out], axis=1
-                    ),
-                    axis=1,
-                )[:, 1:]
-                lev_knot = np.concatenate([lev_knot_in, lev_knot_out], axis=1)
+                lev_knot_walk = lev_knot[:, num_of_knots_in - 1 :]
+                np.cumsum(lev_knot_walk, axis=1, out=lev_knot_walk)
             else:
                 new_knots_tp_level = self.knots_tp_level
                 lev_knot = lev_knot_in
             kernel_level = sandwich_kernel(new_tp, new_knots_tp_level)
         else:
             lev_knot = model.get(BaseSamplingParameters.LEVEL_KNOT.value)
-            kernel_level = sandwich_kernel(new_tp, self.knots_tp_level)
+            if start + output_len <= num_of_observations:
+                # in-sample rows of the level kernel derived at fit time
+                kernel_level = self._kernel_level[start : start + output_len]
+            else:
+                kernel_level = sandwich_kernel(new_tp, self.knots_tp_level)
         obs_scale = model.get(BaseSamplingParameters.OBS_SCALE.value)
         obs_scale = obs_scale.reshape(-1, 1)
 
@@ -1136,19 +1166,37 @@ class KTRModel(ModelTemplate):
         #     # follow component shapes
         #     seas = np.zeros((1, output_len))
 
-        trend = np.matmul(lev_knot, kernel_level.transpose((1, 0)))
-        regression = np.zeros(trend.shape)
+        pred_dtype = np.float32 if self.float32_prediction else np.double
+        if (
+            NUMBA_INSTALLED
+            and lev_knot.ndim == 2
+            and lev_knot.shape[0] >= JIT_TREND_MIN_NUM_OF_SAMPLES
+        ):
+            trend = _sparse_kernel_matmul_numba(
+                np.ascontiguousarray(lev_knot, dtype=pred_dtype),
+                np.ascontiguousarray(kernel_level, dtype=pred_dtype),
+            )
+        else:
+            trend = np.matmul(
+                lev_knot.astype(pred_dtype, copy=False),
+                kernel_level.astype(pred_dtype, copy=False).transpose((1, 0)),
+            )
+        regression = np.zeros(trend.shape, dtype=trend.dtype)
         if self._num_of_regressors > 0:
-            regressor_matrix = df.filter(
-                items=self._regressor_col,
-            ).values
+            regressor_matrix = df[self._regressor_col].to_numpy()
             regressor_betas = self._get_regression_coefs_matrix(
                 training_meta,
                 posterior_estimates,
                 coefficient_method,
                 date_array=prediction_meta[TrainingMetaKeys.DATE_ARRAY.value],
             )
-            regression = np.sum(regressor_betas * regressor_matrix, axis=-1)
+            # regressor_betas may carry leading sample dimensions
+            regression = np.einsum(
+                "...tk,tk->...t",
+                regressor_betas.astype(pred_dtype, copy=False),
+                regressor_matrix.astype(pred_dtype, copy=False),
+                optimize=True,
+            )
 
         if include_error:
             epsilon = nct.rvs(
@@ -1160,7 +1208,9 @@ class KTRModel(ModelTemplate):
             )
             trend += epsilon
 
-        pred_array = trend + total_seas + regression
+        # trend is kept for the decomposition; accumulate the rest in place
+        pred_array = trend + total_seas
+        pred_array += regression
 
         # if decompose output dictionary of components
         decomp_dict = {
@@ -1198,7 +1248,6 @@ class KTRModel(ModelTemplate):
         num_of_observations = training_meta[TrainingMetaKeys.NUM_OF_OBS.value]
         training_start = training_meta[TrainingMetaKeys.START.value]
         training_end = training_meta[TrainingMetaKeys.END.value]
-        train_date_array = training_meta[TrainingMetaKeys.DATE_ARRAY.value]
 
         if (
             self._num_of_regular_regressors
@@ -1220,14 +1269,11 @@ class KTRModel(ModelTemplate):
                 if self.regression_segments == 0:
                     coef_knots = np.expand_dims(coef_knots, -1)
 
-                # result in batch x time step x regressor size shape
+                # result in batch x time step x regressor size shape; keep the kernel as the left
+                # operand so the result comes out of a single matmul without transposing
                 regressor_betas = np.matmul(
-                    coef_knots, self._kernel_coefficients.transpose((1, 0))
+                    self._kernel_coefficients, np.swapaxes(coef_knots, -1, -2)
                 )
-
-                # if len(self._regressor_col) == 1:
-                #     regressor_betas = np.expand_dims(regressor_betas, 0)
-                regressor_betas = regressor_betas.transpose((0, 2, 1))
             elif coefficient_method == "empirical":
                 regressor_betas = posteriors.get(
                     RegressionSamplingParameters.COEFFICIENTS.value
@@ -1237,7 +1283,7 @@ class KTRModel(ModelTemplate):
                     "Wrong coefficient_method:{}".format(coefficient_method)
                 )
         else:
-            date_array = pd.to_datetime(date_array).values
+            date_array = pd.to_datetime(date_array, cache=True).values
             output_len = len(date_array)
             train_len = num_of_observations
             # some validation of date array
@@ -1250,32 +1296,40 @@ class KTRModel(ModelTemplate):
                     "Prediction start must be after training start."
                 )
 
+            # number of times each in-sample coefficient is repeated; out-of-sample periods carry the
+            # last coefficient forward
+            coef_repeats = np.zeros(train_len, dtype=np.intp)
             # If we cannot find a match of prediction range, assume prediction starts right after train end
             if prediction_start > training_end:
                 # time index for prediction start
                 start = train_len
-                coef_repeats = [0] * (start - 1) + [output_len]
+                coef_repeats[-1] = output_len
             else:
                 # time index for prediction start
-                start = pd.Index(train_date_array).get_loc(prediction_start)
+                start = self._get_training_date_idx(prediction_start)
                 if output_len <= train_len - start:
-                    coef_repeats = (
-                        [0] * start
-                        + [1] * output_len
-                        + [0] * (train_len - start - output_len)
-                    )
+                    coef_repeats[start : start + output_len] = 1
                 else:
-                    coef_repeats = (
-                        [0] * start
-                        + [1] * (train_len - start - 1)
-                        + [output_len - train_len + start + 1]
-                    )
+                    coef_repeats[start : train_len - 1] = 1
+                    coef_repeats[-1] = output_len - train_len + start + 1
             new_tp = np.arange(start + 1, start + output_len + 1) / num_of_observations
 
             if coefficient_method == "smooth":
-                kernel_coefficients = gauss_kernel(
-                    new_tp, self._knots_tp_coefficients, rho=self.regression_rho
-                )
+                kernel_key = (start, output_len)
+                if kernel_key == (0, num_of_observations):
+                    # the in-sample kernel is the one derived at fit time
+                    kernel_coefficients = self._kernel_coefficients
+                else:
+                    kernel_coefficients = _get_cached(
+                        self._kernel_coef_cache, kernel_key
+                    )
+                if kernel_coefficients is None:
+                    kernel_coefficients = gauss_kernel(
+                        new_tp, self._knots_tp_coefficients, rho=self.regression_rho
+                    )
+                    _set_cached(
+                        self._kernel_coef_cache, kernel_key, kernel_coefficients
+                    )
 
                 coef_knots = posteriors.get(
                     RegressionSamplingParameters.COEFFICIENTS_KNOT.value
@@ -1287,11 +1341,10 @@ class KTRModel(ModelTemplate):
                     coef_knots = np.expand_dims(coef_knots, -1)
 
                 regressor_betas = np.matmul(
-                    coef_knots, kernel_coefficients.transpose((1, 0))
+                    kernel_coefficients, np.swapaxes(coef_knots, -1, -2)
                 )
                 if len(regressor_betas.shape) == 2:
                     regressor_betas = np.expand_dims(regressor_betas, 0)
-                regressor_betas = regressor_betas.transpose((0, 2, 1))
             elif coefficient_method == "empirical":
                 regressor_betas = posteriors.get(
                     RegressionSamplingParameters.COEFFICIENTS.value
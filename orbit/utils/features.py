@@ -26,12 +26,12 @@ def make_fourier_series(n, period, order=3, shift=0):
         2. Original idea from https://github.com/facebook/prophet under
     """
     t = np.arange(1, n + 1) + shift
-    out = list()
-    for i in range(1, order + 1):
-        x = 2.0 * i * np.pi * t / period
-        out.append(np.cos(x))
-        out.append(np.sin(x))
-    out = np.column_stack(out)
+    # all orders at once in a single (n, order) block
+    x = np.outer(t, 2.0 * np.arange(1, order + 1) * np.pi) / period
+    # columns are interleaved as cos1, sin1, cos2, sin2, ...
+    out = np.empty((n, 2 * order), dtype=np.double)
+    np.cos(x, out=out[:, 0::2])
+    np.sin(x, out=out[:, 1::2])
     return out
 
 
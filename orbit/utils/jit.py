@@ -0,0 +1,17 @@
+try:
+    from numba import njit, prange
+
+    NUMBA_INSTALLED = True
+except ImportError:
+    NUMBA_INSTALLED = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """A no-op replacement of `numba.njit` when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
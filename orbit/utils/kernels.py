@@ -1,5 +1,7 @@
 import numpy as np
 
+from .jit import NUMBA_INSTALLED, njit, prange
+
 
 def reduce_by_max(x, n=2):
     out = x.copy()
@@ -7,6 +9,12 @@ def reduce_by_max(x, n=2):
     return out
 
 
+@njit(cache=True)
+def _kernel_block_size(num_of_cols):
+    """number of rows to compute at a time when tiling an (N, M) kernel matrix"""
+    return min(max(4096 // max(num_of_cols, 1), 64), 4096)
+
+
 # Gaussian-Kernel
 # https://en.wikipedia.org/wiki/Kernel_smoother
 def gauss_kernel(x, x_i, rho=0.1, alpha=1.0, n_reduce=-1, point_to_flatten=1):
@@ -39,17 +47,43 @@ def gauss_kernel(x, x_i, rho=0.1, alpha=1.0, n_reduce=-1, point_to_flatten=1):
     1. https://mc-stan.org/docs/2_24/stan-users-guide/gaussian-process-regression.html
     2. https://en.wikipedia.org/wiki/Local_regression
     """
+    x = np.asarray(x, dtype=np.double)
+    x_i = np.asarray(x_i, dtype=np.double)
+    if NUMBA_INSTALLED and n_reduce <= 0:
+        return _gauss_kernel_numba(
+            x, x_i, rho=rho, alpha=alpha, point_to_flatten=point_to_flatten
+        )
+    return _gauss_kernel_numpy(
+        x,
+        x_i,
+        rho=rho,
+        alpha=alpha,
+        n_reduce=n_reduce,
+        point_to_flatten=point_to_flatten,
+    )
+
+
+def _gauss_kernel_numpy(x, x_i, rho=0.1, alpha=1.0, n_reduce=-1, point_to_flatten=1):
+    """Vectorized version of :func:`gauss_kernel` used when numba is not installed or `n_reduce` is
+    required"""
+    x = np.asarray(x, dtype=np.double)
+    x_i = np.asarray(x_i, dtype=np.double)
     N = len(x)
     M = len(x_i)
-    k = np.zeros((N, M), np.double)
+    k = np.empty((N, M), np.double)
     alpha_sq = alpha**2
     rho_sq_t2 = 2 * rho**2
-    for n in range(N):
-        if x[n] <= point_to_flatten:
-            k[n, :] = alpha_sq * np.exp(-1 * (x[n] - x_i) ** 2 / rho_sq_t2)
-        else:
-            # last weights carried forward for future time points
-            k[n, :] = alpha_sq * np.exp(-1 * (point_to_flatten - x_i) ** 2 / rho_sq_t2)
+    # last weights carried forward for future time points
+    x = np.where(x <= point_to_flatten, x, point_to_flatten)
+    block_size = _kernel_block_size(M)
+    for start in range(0, N, block_size):
+        # compute the kernel block by block such that the intermediate results stay in cache
+        k_block = k[start : start + block_size]
+        np.subtract(x[start : start + block_size, None], x_i, out=k_block)
+        np.square(k_block, out=k_block)
+        np.multiply(k_block, -1 / rho_sq_t2, out=k_block)
+        np.exp(k_block, out=k_block)
+        np.multiply(k_block, alpha_sq, out=k_block)
 
     if n_reduce > 0:
         k = np.apply_along_axis(reduce_by_max, axis=1, arr=k, n=n_reduce)
@@ -59,6 +93,35 @@ def gauss_kernel(x, x_i, rho=0.1, alpha=1.0, n_reduce=-1, point_to_flatten=1):
     return k
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _gauss_kernel_numba(x, x_i, rho=0.1, alpha=1.0, point_to_flatten=1.0):
+    """Jit-compiled version of :func:`gauss_kernel` without `n_reduce` support. The subtraction, square,
+    exponential and normalization are fused into a single pass per entry point, and entry points are
+    distributed across threads in row blocks.
+    """
+    N = x.shape[0]
+    M = x_i.shape[0]
+    k = np.empty((N, M), dtype=np.double)
+    alpha_sq = alpha**2
+    rho_sq_t2 = 2 * rho**2
+    block_size = _kernel_block_size(M)
+    num_of_blocks = (N + block_size - 1) // block_size
+    for b in prange(num_of_blocks):
+        for n in range(b * block_size, min((b + 1) * block_size, N)):
+            # last weights carried forward for future time points
+            x_n = min(x[n], point_to_flatten)
+            row_sum = 0.0
+            for m in range(M):
+                d = x_n - x_i[m]
+                w = alpha_sq * np.exp(-1 * d * d / rho_sq_t2)
+                k[n, m] = w
+                row_sum += w
+            for m in range(M):
+                k[n, m] /= row_sum
+
+    return k
+
+
 def sandwich_kernel(x, x_i):
     """
     Parameters
@@ -81,23 +144,32 @@ def sandwich_kernel(x, x_i):
     1. https://mc-stan.org/docs/2_24/stan-users-guide/gaussian-process-regression.html
     2. https://en.wikipedia.org/wiki/Local_regression
     """
+    x = np.asarray(x, dtype=np.double)
+    x_i = np.asarray(x_i, dtype=np.double)
+    if NUMBA_INSTALLED:
+        return _sandwich_kernel_numba(x, x_i)
+    return _sandwich_kernel_numpy(x, x_i)
+
+
+def _sandwich_kernel_numpy(x, x_i):
+    """Vectorized version of :func:`sandwich_kernel` used when numba is not installed"""
     N = len(x)
     M = len(x_i)
     k = np.zeros((N, M), dtype=np.double)
 
-    np_idx = np.where(x < x_i[0])
-    k[np_idx, 0] = 1
+    # locate the enclosing segment of each entry point i.e. x_i[m] <= x < x_i[m + 1]
+    seg_idx = np.searchsorted(x_i, x, side="right") - 1
 
-    for m in range(M - 1):
-        np_idx = np.where(np.logical_and(x >= x_i[m], x < x_i[m + 1]))
-        total_dist = x_i[m + 1] - x_i[m]
-        backward_dist = x[np_idx] - x_i[m]
-        forward_dist = x_i[m + 1] - x[np_idx]
-        k[np_idx, m] = forward_dist / total_dist
-        k[np_idx, m + 1] = backward_dist / total_dist
+    k[seg_idx < 0, 0] = 1
+    k[seg_idx >= M - 1, M - 1] = 1
 
-    np_idx = np.where(x >= x_i[M - 1])
-    k[np_idx, M - 1] = 1
+    rows = np.flatnonzero((seg_idx >= 0) & (seg_idx < M - 1))
+    m = seg_idx[rows]
+    total_dist = x_i[m + 1] - x_i[m]
+    backward_dist = x[rows] - x_i[m]
+    forward_dist = x_i[m + 1] - x[rows]
+    k[rows, m] = forward_dist / total_dist
+    k[rows, m + 1] = backward_dist / total_dist
 
     # TODO: it is probably not needed
     k = k / np.sum(k, axis=1, keepdims=True)
@@ -105,6 +177,81 @@ def sandwich_kernel(x, x_i):
     return k
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _sandwich_kernel_numba(x, x_i):
+    """Jit-compiled version of :func:`sandwich_kernel`. Each entry point only looks up its enclosing pair of
+    reference points instead of scanning all segments.
+    """
+    N = x.shape[0]
+    M = x_i.shape[0]
+    k = np.zeros((N, M), dtype=np.double)
+    for n in prange(N):
+        x_n = x[n]
+        if x_n < x_i[0]:
+            k[n, 0] = 1.0
+        elif x_n >= x_i[M - 1]:
+            k[n, M - 1] = 1.0
+        else:
+            # x_i[m] <= x_n < x_i[m + 1]
+            m = np.searchsorted(x_i, x_n, side="right") - 1
+            total_dist = x_i[m + 1] - x_i[m]
+            forward_w = (x_i[m + 1] - x_n) / total_dist
+            backward_w = (x_n - x_i[m]) / total_dist
+            row_sum = forward_w + backward_w
+            k[n, m] = forward_w / row_sum
+            k[n, m + 1] = backward_w / row_sum
+
+    return k
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _sparse_kernel_matmul_numba(w, k):
+    """Jit-compiled equivalent of `np.matmul(w, k.T)` for sparse kernels such as :func:`sandwich_kernel`
+    with at most a few positive weights per entry point. The non-zero weights of the kernel are gathered
+    once and rows of `w` are distributed across threads.
+
+    Parameters
+    ----------
+    w : 2D array-like
+        weights of the reference points with shape num_of_samples x M
+    k : 2D array-like
+        kernel with shape N x M
+
+    Returns
+    -------
+    np.ndarray
+        2D array with shape num_of_samples x N
+    """
+    num_of_samples = w.shape[0]
+    N, M = k.shape
+    # compressed rows of the kernel
+    indptr = np.zeros(N + 1, dtype=np.int64)
+    for n in range(N):
+        nnz = 0
+        for m in range(M):
+            if k[n, m] != 0.0:
+                nnz += 1
+        indptr[n + 1] = indptr[n] + nnz
+    indices = np.empty(indptr[N], dtype=np.int64)
+    weights = np.empty(indptr[N], dtype=k.dtype)
+    for n in range(N):
+        pos = indptr[n]
+        for m in range(M):
+            if k[n, m] != 0.0:
+                indices[pos] = m
+                weights[pos] = k[n, m]
+                pos += 1
+
+    out = np.empty((num_of_samples, N), dtype=w.dtype)
+    for s in prange(num_of_samples):
+        for n in range(N):
+            acc = 0.0
+            for j in range(indptr[n], indptr[n + 1]):
+                acc += weights[j] * w[s, indices[j]]
+            out[s, n] = acc
+    return out
+
+
 def parabolic_kernel(x, x_i):
     # TODO: docstring
     N = len(x)
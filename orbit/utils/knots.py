@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 from ..exceptions import IllegalArgument
+from .jit import NUMBA_INSTALLED, njit, prange
 
 
 def get_knot_dates(start_date, knot_idx, freq):
@@ -34,9 +35,12 @@ def get_dates_delta(start_date, end_date, time_delta):
     end_date : numpy datetime array
     time_delta : time delta between dates
     """
-    date_diff = end_date - start_date
+    # integer nanoseconds arithmetic over the datetime64 buffer
+    start_ns = np.datetime64(pd.Timestamp(start_date), "ns").astype(np.int64)
+    end_ns = np.asarray(end_date, dtype="datetime64[ns]").astype(np.int64)
+    date_diff = end_ns - start_ns
     # can also be deemed as the "knot_idx"
-    norm_delta = np.round(date_diff / time_delta).astype(int)
+    norm_delta = np.round(date_diff / pd.Timedelta(time_delta).value).astype(int)
 
     return norm_delta
 
@@ -45,11 +49,12 @@ def get_knot_idx_by_dist(num_of_obs, knot_distance):
     """function to calculate the knot idx based on num_of_obs and knot_distance."""
     # starts with the the ending point
     # use negative values or simply append 0 to the sequence?
-    knot_idx = np.sort(np.arange(num_of_obs - 1, -1, -knot_distance))
+    # the descending range only needs to be reversed to be sorted
+    knot_idx = np.arange(num_of_obs - 1, -1, -knot_distance)[::-1]
     knot_idx = np.round(knot_idx).astype("int")
-    if 0 not in knot_idx:
-        # knot_idx = np.sort(np.arange(num_of_obs - 1, -1 - knot_distance, -knot_distance))
-        knot_idx = np.sort(np.append(knot_idx, 0))
+    if not np.any(knot_idx == 0):
+        # insert in place of appending and re-sorting
+        knot_idx = np.insert(knot_idx, np.searchsorted(knot_idx, 0), 0)
 
     return knot_idx
 
@@ -100,19 +105,18 @@ def get_knot_idx(
             )
         knot_dates = np.array(knot_dates, dtype="datetime64")
 
-        # filter out
-        _knot_dates = pd.to_datetime(
-            [
-                x
-                for x in knot_dates
-                if (x <= date_array.max()) and (x >= date_array.min())
-            ]
+        # filter out knot dates beyond the date array
+        in_range = (knot_dates >= np.datetime64(date_array.min())) & (
+            knot_dates <= np.datetime64(date_array.max())
         )
+        _knot_dates = pd.to_datetime(knot_dates[in_range], cache=True)
 
-        time_delta = date_array.diff().mean()
+        # mean of the consecutive differences without materializing them
+        dates = np.asarray(date_array, dtype="datetime64[ns]")
+        time_delta = (dates[-1] - dates[0]) / (len(dates) - 1)
 
         knot_idx = get_dates_delta(
-            start_date=date_array[0], end_date=_knot_dates, time_delta=time_delta
+            start_date=dates[0], end_date=_knot_dates, time_delta=time_delta
         )
 
     elif knot_distance is not None:
@@ -135,3 +139,89 @@ def get_knot_idx(
 
     # knot_idx starts with 0; need to add 1 when calculate the fraction
     return knot_idx
+
+
+def get_knot_scale_multiplier(regressor_matrix, starts, ends, lower_bound):
+    """Derive the knot scale multiplier of each regressor and segment. When the average absolute volume of a
+    segment is less than 1% of the global average of the regressor, `lower_bound` is used as the multiplier;
+    otherwise 1. Empty segments always get 1.
+
+    Parameters
+    ----------
+    regressor_matrix : 2D array-like
+        regressor matrix with shape num_of_obs x num_of_regressors
+    starts : 1D array-like
+        start index (inclusive) of each segment i.e. the knot indices
+    ends : 1D array-like
+        end index (exclusive) of each segment
+    lower_bound : float
+        multiplier used on segments with low volume
+
+    Returns
+    -------
+    np.ndarray
+        2D array with shape num_of_regressors x num_of_knots
+    """
+    regressor_matrix = np.asarray(regressor_matrix, dtype=np.double)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    if NUMBA_INSTALLED:
+        return _knot_scale_multiplier_numba(regressor_matrix, starts, ends, lower_bound)
+    return _knot_scale_multiplier_numpy(regressor_matrix, starts, ends, lower_bound)
+
+
+def _knot_scale_multiplier_numpy(regressor_matrix, starts, ends, lower_bound):
+    """Vectorized version of :func:`get_knot_scale_multiplier` used when numba is not installed"""
+    abs_matrix = np.fabs(regressor_matrix)
+    lengths = ends - starts
+    valid = lengths > 0
+    multiplier = np.ones((regressor_matrix.shape[1], starts.shape[0]))
+    if not np.any(valid):
+        return multiplier
+    # segment sums as differences of the prefix sums so any segment bounds are supported
+    cum_sum = np.zeros((abs_matrix.shape[0] + 1, abs_matrix.shape[1]))
+    np.cumsum(abs_matrix, axis=0, out=cum_sum[1:])
+    local_sum = cum_sum[ends[valid]] - cum_sum[starts[valid]]
+    local_val = (local_sum / lengths[valid, None]).T
+    global_mean = np.expand_dims(np.mean(abs_matrix, axis=0), -1)
+    multiplier[:, valid] = np.where(local_val < 0.01 * global_mean, lower_bound, 1.0)
+    return multiplier
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _knot_scale_multiplier_numba(regressor_matrix, starts, ends, lower_bound):
+    """Jit-compiled version of :func:`get_knot_scale_multiplier`. Segment sums are taken in a single pass per
+    regressor and regressors are distributed across threads.
+    """
+    num_of_obs, num_of_regressors = regressor_matrix.shape
+    num_of_knots = starts.shape[0]
+    # when segments are sorted and contiguous up to the end of the series, the global sum is the sum over the
+    # observations before the first knot plus the segment sums; each absolute value is then read only once
+    contiguous = num_of_knots > 0 and ends[num_of_knots - 1] == num_of_obs
+    for s in range(num_of_knots):
+        if ends[s] < starts[s] or (s < num_of_knots - 1 and ends[s] != starts[s + 1]):
+            contiguous = False
+    multiplier = np.ones((num_of_regressors, num_of_knots))
+    for r in prange(num_of_regressors):
+        local_sums = np.zeros(num_of_knots)
+        for s in range(num_of_knots):
+            local_sum = 0.0
+            for t in range(starts[s], ends[s]):
+                local_sum += abs(regressor_matrix[t, r])
+            local_sums[s] = local_sum
+        global_sum = 0.0
+        if contiguous:
+            for t in range(starts[0]):
+                global_sum += abs(regressor_matrix[t, r])
+            for s in range(num_of_knots):
+                global_sum += local_sums[s]
+        else:
+            for t in range(num_of_obs):
+                global_sum += abs(regressor_matrix[t, r])
+        global_mean = global_sum / num_of_obs
+        for s in range(num_of_knots):
+            if ends[s] <= starts[s]:
+                continue
+            if local_sums[s] / (ends[s] - starts[s]) < 0.01 * global_mean:
+                multiplier[r, s] = lower_bound
+    return multiplier
@@ -0,0 +1,9 @@
+from importlib import import_module
+
+
+def get_numpyro_model(model_name):
+    numpyro_module_str = "orbit.numpyro.{}".format(model_name)
+    module = import_module(numpyro_module_str)
+    model = getattr(module, "Model")
+
+    return model
@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 
 from orbit.models import KTR
+from orbit.template.ktr import MAX_PREDICTION_CACHE_SIZE
 from orbit.diagnostics.metrics import smape
 
 SMAPE_TOLERANCE = 0.2
@@ -129,6 +130,132 @@ def test_ktr_regression(make_daily_data, regressor_col):
     assert np.all(np.isfinite(predict_df["prediction"].values))
 
 
+@pytest.mark.parametrize("regressor_col", [None, ["a", "b", "c"]])
+@pytest.mark.parametrize(
+    "make_daily_data", [({"seasonality": "dual", "with_coef": True})], indirect=True
+)
+def test_ktr_numpyro_svi(make_daily_data, regressor_col):
+    pytest.importorskip("numpyro")
+    import jax
+
+    train_df, test_df, coef = make_daily_data
+
+    ktr = KTR(
+        response_col="response",
+        date_col="date",
+        seasonality=[7, 365.25],
+        seasonality_fs_order=[2, 5],
+        regressor_col=regressor_col,
+        estimator="numpyro-svi",
+        num_steps=100,
+        num_sample=100,
+        n_bootstrap_draws=-1,
+    )
+
+    ktr.fit(train_df)
+    # 64-bit mode is only enabled within the fit
+    assert not jax.config.read("jax_enable_x64")
+    predict_df = ktr.predict(test_df)
+
+    expected_columns = ["date", "prediction_5", "prediction", "prediction_95"]
+    expected_shape = (364, len(expected_columns))
+
+    assert predict_df.shape == expected_shape
+    assert predict_df.columns.tolist() == expected_columns
+    assert np.all(np.isfinite(predict_df["prediction"].values))
+
+
+@pytest.mark.parametrize("regressor_col", [None, ["a", "b", "c"]])
+@pytest.mark.parametrize(
+    "make_daily_data", [({"seasonality": "dual", "with_coef": True})], indirect=True
+)
+def test_ktr_jit_compile(make_daily_data, regressor_col):
+    train_df, test_df, coef = make_daily_data
+
+    ktr = KTR(
+        response_col="response",
+        date_col="date",
+        seasonality=[7, 365.25],
+        seasonality_fs_order=[2, 5],
+        regressor_col=regressor_col,
+        estimator="pyro-svi",
+        num_steps=10,
+        num_sample=100,
+        n_bootstrap_draws=-1,
+        jit_compile=True,
+    )
+
+    ktr.fit(train_df)
+    predict_df = ktr.predict(test_df)
+
+    expected_columns = ["date", "prediction_5", "prediction", "prediction_95"]
+    expected_shape = (364, len(expected_columns))
+
+    assert predict_df.shape == expected_shape
+    assert predict_df.columns.tolist() == expected_columns
+    assert np.all(np.isfinite(predict_df["prediction"].values))
+
+
+@pytest.mark.parametrize(
+    "make_daily_data", [({"seasonality": "dual", "with_coef": True})], indirect=True
+)
+def test_ktr_float32_prediction(make_daily_data):
+    train_df, test_df, coef = make_daily_data
+
+    args = dict(
+        response_col="response",
+        date_col="date",
+        seasonality=[7, 365.25],
+        seasonality_fs_order=[2, 5],
+        regressor_col=["a", "b", "c"],
+        estimator="pyro-svi",
+        num_steps=100,
+        num_sample=100,
+        n_bootstrap_draws=-1,
+        seed=2022,
+    )
+    ktr = KTR(**args)
+    ktr.fit(train_df)
+    expected_df = ktr.predict(test_df, seed=2022)
+
+    ktr = KTR(float32_prediction=True, **args)
+    assert ktr._model.float32_prediction
+    ktr.fit(train_df)
+    predict_df = ktr.predict(test_df, seed=2022)
+
+    assert predict_df.shape == expected_df.shape
+    assert np.allclose(
+        predict_df["prediction"].values, expected_df["prediction"].values, rtol=1e-4
+    )
+
+
+@pytest.mark.parametrize(
+    "make_daily_data", [({"seasonality": "dual", "with_coef": True})], indirect=True
+)
+def test_ktr_prediction_cache_size(make_daily_data):
+    train_df, test_df, coef = make_daily_data
+
+    ktr = KTR(
+        response_col="response",
+        date_col="date",
+        seasonality=[7, 365.25],
+        seasonality_fs_order=[2, 5],
+        regressor_col=["a", "b", "c"],
+        estimator="pyro-svi",
+        num_steps=10,
+        num_sample=10,
+        n_bootstrap_draws=-1,
+    )
+
+    ktr.fit(train_df)
+    # rolling prediction windows
+    for i in range(2 * MAX_PREDICTION_CACHE_SIZE):
+        ktr.predict(test_df[i:], seed=2022)
+
+    assert len(ktr._model._kernel_coef_cache) == MAX_PREDICTION_CACHE_SIZE
+    assert len(ktr._model._seas_cache) == MAX_PREDICTION_CACHE_SIZE
+
+
 @pytest.mark.parametrize(
     "regression_knot_dates",
     [pd.date_range(start="2016-03-01", end="2019-01-01", freq="3M")],
@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+from orbit.utils.kernels import (
+    _gauss_kernel_numpy,
+    _gauss_kernel_numba,
+    _sandwich_kernel_numpy,
+    _sandwich_kernel_numba,
+    _sparse_kernel_matmul_numba,
+)
+
+
+@pytest.mark.parametrize("rho", [0.05, 0.15])
+@pytest.mark.parametrize("num_of_knots", [1, 6])
+def test_gauss_kernel_numba(rho, num_of_knots):
+    # include points beyond 1 to cover the flatten part
+    x = np.arange(1, 121) / 100
+    x_i = np.linspace(0, 1, num_of_knots)
+    expected = _gauss_kernel_numpy(x, x_i, rho=rho)
+    out = _gauss_kernel_numba(x, x_i, rho=rho)
+
+    assert out.shape == (len(x), num_of_knots)
+    assert np.allclose(out, expected)
+    assert np.allclose(np.sum(out, axis=1), 1.0)
+
+
+@pytest.mark.parametrize("num_of_knots", [1, 6])
+def test_sandwich_kernel_numba(num_of_knots):
+    # include points before the first knot and beyond the last knot
+    x = np.arange(1, 121) / 100
+    x_i = np.linspace(0.1, 1, num_of_knots)
+    expected = _sandwich_kernel_numpy(x, x_i)
+    out = _sandwich_kernel_numba(x, x_i)
+
+    assert out.shape == (len(x), num_of_knots)
+    assert np.allclose(out, expected)
+    assert np.allclose(np.sum(out, axis=1), 1.0)
+
+
+@pytest.mark.parametrize("dtype", [np.double, np.float32])
+@pytest.mark.parametrize("num_of_knots", [1, 6])
+def test_sparse_kernel_matmul_numba(num_of_knots, dtype):
+    # include points before the first knot and beyond the last knot
+    x = np.arange(1, 121) / 100
+    x_i = np.linspace(0.1, 1, num_of_knots)
+    k = _sandwich_kernel_numpy(x, x_i).astype(dtype)
+    w = np.random.default_rng(2022).normal(size=(1200, num_of_knots)).astype(dtype)
+    expected = np.matmul(w, k.T)
+    out = _sparse_kernel_matmul_numba(w, k)
+
+    assert out.shape == (1200, len(x))
+    assert out.dtype == dtype
+    assert np.allclose(out, expected, rtol=1e-5, atol=1e-5)
@@ -1,7 +1,12 @@
 import pytest
 import numpy as np
 import pandas as pd
-from orbit.utils.knots import get_knot_idx, get_knot_dates
+from orbit.utils.knots import (
+    get_knot_idx,
+    get_knot_dates,
+    _knot_scale_multiplier_numpy,
+    _knot_scale_multiplier_numba,
+)
 
 
 @pytest.mark.parametrize("num_of_segments", [0, 1, 3, 10])
@@ -75,3 +80,31 @@ def test_dates_args(dataset, date_col, knot_dates, knot_idx, request):
 
     assert np.all(knot_idx2 == knot_idx)
     assert np.all(knot_dates2 == knot_dates)
+
+
+@pytest.mark.parametrize(
+    "starts, ends",
+    [
+        ([0, 20, 40, 60], [20, 40, 60, 100]),
+        # empty segments from duplicated knots
+        ([0, 20, 20, 60], [20, 20, 60, 100]),
+        # segments not covering the whole series
+        ([10, 50], [30, 60]),
+    ],
+)
+def test_knot_scale_multiplier_numba(starts, ends):
+    rng = np.random.default_rng(2022)
+    regressor_matrix = rng.normal(size=(100, 3))
+    # low volume segments in the first two regressors
+    regressor_matrix[20:60, 0] *= 1e-4
+    regressor_matrix[50:60, 1] = 0.0
+    starts = np.array(starts, dtype=np.int64)
+    ends = np.array(ends, dtype=np.int64)
+    expected = _knot_scale_multiplier_numpy(regressor_matrix, starts, ends, 0.01)
+    out = _knot_scale_multiplier_numba(regressor_matrix, starts, ends, 0.01)
+
+    assert out.shape == (3, len(starts))
+    assert np.allclose(out, expected)
+    assert np.any(out == 0.01)
+    # empty segments keep the upper bound
+    assert np.all(out[:, starts == ends] == 1.0)